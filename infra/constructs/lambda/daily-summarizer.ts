@@ -9,6 +9,7 @@ import * as cdk from "aws-cdk-lib";
 export interface DailySummaryProcessorProps {
   conversationTable: dynamodb.ITable;
   dailySummaryTable: dynamodb.ITable;
+  userSummaryTable: dynamodb.ITable;
   openAiApiKeyParameterName: string;
 }
 
@@ -27,6 +28,7 @@ export class DailySummaryProcessor extends Construct {
       environment: {
         CONVERSATION_TABLE_NAME: props.conversationTable.tableName,
         DAILY_SUMMARY_TABLE_NAME: props.dailySummaryTable.tableName,
+        USER_SUMMARY_TABLE_NAME: props.userSummaryTable.tableName,
         OPENAI_API_KEY_PARAMETER_NAME: props.openAiApiKeyParameterName,
         PROCESS_ONLY_YESTERDAY: "false",
       },
@@ -41,6 +43,7 @@ export class DailySummaryProcessor extends Construct {
 
     props.conversationTable.grantReadData(this.lambda);
     props.dailySummaryTable.grantWriteData(this.lambda);
+    props.userSummaryTable.grantReadWriteData(this.lambda);
 
     // Schedule daily summary generation
     // new events.Rule(this, 'DailySummaryRule', {
@@ -11,6 +11,7 @@ import * as cdk from "aws-cdk-lib";
 export interface MonthlySummaryProcessorProps {
   dailySummaryTable: dynamodb.ITable;
   monthlySummaryTable: dynamodb.ITable;
+  userSummaryTable: dynamodb.ITable;
   openAiApiKeyParameterName: string;
 }
 
@@ -36,8 +37,10 @@ export class MonthlySummaryProcessor extends Construct {
         environment: {
           DAILY_SUMMARY_TABLE_NAME: props.dailySummaryTable.tableName,
           MONTHLY_SUMMARY_TABLE_NAME: props.monthlySummaryTable.tableName,
+          USER_SUMMARY_TABLE_NAME: props.userSummaryTable.tableName,
           OPENAI_API_KEY_PARAMETER_NAME: props.openAiApiKeyParameterName,
           PROCESS_ONLY_LAST_MONTH: "false",
+          MONTHLY_CONTEXT_FIELD_CHARS: "0",
         },
       }
     );
@@ -51,6 +54,7 @@ export class MonthlySummaryProcessor extends Construct {
 
     props.dailySummaryTable.grantReadData(this.lambda);
     props.monthlySummaryTable.grantWriteData(this.lambda);
+    props.userSummaryTable.grantWriteData(this.lambda);
 
     // Schedule monthly summary generation
     new events.Rule(this, "MonthlySummaryRule", {
@@ -6,10 +6,12 @@ from daily_summary import daily_summary
 from language_communication import evaluate_language_communication
 from cognitive_development import evaluate_cognitive_development
 from social_emotional import evaluate_social_emotional
+from user_summary import put_daily_scores
 
 dynamodb = boto3.resource('dynamodb')
 conversation_table = dynamodb.Table(os.environ['CONVERSATION_TABLE_NAME'])
 daily_summary_table = dynamodb.Table(os.environ['DAILY_SUMMARY_TABLE_NAME'])
+user_summary_table = dynamodb.Table(os.environ['USER_SUMMARY_TABLE_NAME'])
 ssm = boto3.client('ssm')
 
 def get_openai_api_key():
@@ -90,6 +92,19 @@ def lambda_handler(event, context):
                     'social_emotional_social_interaction': social_emotional.social_interaction,
                 }
             )
+
+            # Keep the per-user materialized view in sync for dashboard reads
+            put_daily_scores(
+                user_summary_table,
+                item['userId'],
+                date,
+                summary.summary_title,
+                {
+                    'language_communication_score': language_communication.score,
+                    'cognitive_development_score': ognitive_development.score,
+                    'social_emotional_score': social_emotional.score,
+                }
+            )
             
             print(f"Daily summary for {date} generated and stored successfully")
         
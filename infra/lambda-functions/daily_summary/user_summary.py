@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# UserSummaryTable is partitioned by userId so a parent dashboard can read a
+# child's whole timeline with a single key-range query on the sort key:
+#   DAY#YYYY-MM-DD  -> compact daily scores plus rolling 7/30/90 day averages
+#   MONTH#YYYY-MM   -> monthly averages (written by the monthly summarizer)
+DAY_PREFIX = 'DAY#'
+SCORE_FIELDS = [
+    'language_communication_score',
+    'cognitive_development_score',
+    'social_emotional_score',
+]
+ROLLING_WINDOWS = [7, 30, 90]
+
+def day_key(date):
+    return f"{DAY_PREFIX}{date}"
+
+def average_scores(rows):
+    averages = {}
+    for score_type in SCORE_FIELDS:
+        total = sum(Decimal(row[score_type]) for row in rows)
+        averages[score_type] = Decimal(str(round(float(total) / len(rows), 2)))
+    averages['days'] = len(rows)
+    return averages
+
+def shift_date(date, days):
+    return (datetime.strptime(date, '%Y-%m-%d') + timedelta(days=days)).strftime('%Y-%m-%d')
+
+def get_daily_rows(table, user_id, start_date, end_date):
+    query_args = {
+        'KeyConditionExpression': 'userId = :user_id AND sk BETWEEN :start AND :end',
+        'ExpressionAttributeValues': {
+            ':user_id': user_id,
+            ':start': day_key(start_date),
+            ':end': day_key(end_date),
+        },
+    }
+    response = table.query(**query_args)
+    rows = response['Items']
+    while 'LastEvaluatedKey' in response:
+        response = table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query_args)
+        rows.extend(response['Items'])
+    return rows
+
+def calculate_rolling_windows(rows, date):
+    windows = {}
+    for days in ROLLING_WINDOWS:
+        start_date = shift_date(date, -(days - 1))
+        window_rows = [row for row in rows if start_date <= row['date'] <= date]
+        if window_rows:
+            windows[f"avg_{days}d"] = average_scores(window_rows)
+    return windows
+
+def put_daily_scores(table, user_id, date, summary_title, scores):
+    """Write the compact DAY# row for a user and refresh its rolling windows.
+
+    Any later DAY# rows whose windows include this date are rewritten too, so
+    re-running a single past date keeps the view consistent. One query
+    spanning the longest window on both sides covers every affected row.
+    """
+    longest = max(ROLLING_WINDOWS)
+    rows = get_daily_rows(table, user_id, shift_date(date, -(longest - 1)), shift_date(date, longest - 1))
+    # Replace any stale row for this date with the fresh scores
+    rows = [row for row in rows if row['date'] != date]
+    item = {
+        'userId': user_id,
+        'sk': day_key(date),
+        'date': date,
+        'summary_title': summary_title,
+        **scores,
+    }
+    rows.append(item)
+
+    for row in sorted(rows, key=lambda r: r['date']):
+        if row['date'] < date:
+            continue
+        for days in ROLLING_WINDOWS:
+            row.pop(f"avg_{days}d", None)
+        row.update(calculate_rolling_windows(rows, row['date']))
+        table.put_item(Item=row)
+    return item
@@ -7,14 +7,29 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from langchain.output_parsers import PydanticOutputParser
+from monthly_context import encode_average_scores, encode_monthly_context
 
 dynamodb = boto3.resource('dynamodb')
 daily_summary_table = dynamodb.Table(os.environ['DAILY_SUMMARY_TABLE_NAME'])
 monthly_summary_table = dynamodb.Table(os.environ['MONTHLY_SUMMARY_TABLE_NAME'])
+user_summary_table = dynamodb.Table(os.environ['USER_SUMMARY_TABLE_NAME'])
 ssm = boto3.client('ssm')
 
 PROCESS_ONLY_LAST_MONTH = os.environ.get('PROCESS_ONLY_LAST_MONTH', 'true').lower() == 'true'
 
+def get_context_field_chars():
+    # Optional per-field character budget for the compact monthly prompt context;
+    # missing, invalid or non-positive values mean no limit
+    value = os.environ.get('MONTHLY_CONTEXT_FIELD_CHARS', '0')
+    try:
+        max_chars = int(value)
+    except ValueError:
+        print(f"Ignoring invalid MONTHLY_CONTEXT_FIELD_CHARS value: {value}")
+        return None
+    return max_chars if max_chars > 0 else None
+
+MONTHLY_CONTEXT_FIELD_CHARS = get_context_field_chars()
+
 class MonthlySummary(BaseModel):
     summary: str = Field(description=" A concise summary of the conversation content for that month")
     language_communication_explanation: str = Field(description="A brief 2-sentence explanation of language and communication development")
@@ -52,17 +67,25 @@ def calculate_average_scores(data):
 
     return {score_type: total / count for score_type, total in total_scores.items()}
 
-def decimal_to_float(obj):
-    if isinstance(obj, Decimal):
-        return float(obj)
-    raise TypeError
+def put_user_month(summary, days):
+    # Mirror the monthly averages into the user-partitioned view next to the
+    # DAY# rows written by the daily summarizer
+    user_summary_table.put_item(
+        Item={
+            'userId': summary['userId'],
+            'sk': f"MONTH#{summary['month']}",
+            'month': summary['month'],
+            'language_communication_score': summary['language_communication_score'],
+            'cognitive_development_score': summary['cognitive_development_score'],
+            'social_emotional_score': summary['social_emotional_score'],
+            'days': days,
+        }
+    )
 
 def generate_monthly_summary(data, average_scores, api_key):
     llm = ChatOpenAI(temperature=0.2, api_key=api_key)
     parser = PydanticOutputParser(pydantic_object=MonthlySummary)
 
-    float_average_scores = json.loads(json.dumps(average_scores, default=decimal_to_float))
-
     prompt = ChatPromptTemplate.from_template(
         """
         Analyze the following monthly data and provide:
@@ -72,7 +95,7 @@ def generate_monthly_summary(data, average_scores, api_key):
            - Cognitive development
            - Social and emotional development
         3. A list of 10 most important and frequently used notable words during the month
-           (Pay special attention to the 'language_communication_notable_words' field in each day's data.)
+           (Pay special attention to the 'notable words' list, which gives, for each word, the number of days it was noted (word:days).)
 
         Average scores for the month:
         {average_scores}
@@ -80,15 +103,16 @@ def generate_monthly_summary(data, average_scores, api_key):
         Use this format:
         {format_instructions}
 
-        Monthly data:
+        Monthly data (per-day scores table, notable words, then daily notes;
+        text repeated from an earlier day is omitted):
         {monthly_data}
         """
     )
 
     chain = prompt | llm | parser
     result = chain.invoke({
-        "average_scores": json.dumps(float_average_scores, indent=2),
-        "monthly_data": json.dumps(data, default=decimal_to_float, indent=2),
+        "average_scores": encode_average_scores(average_scores),
+        "monthly_data": encode_monthly_context(data, MONTHLY_CONTEXT_FIELD_CHARS),
         "format_instructions": parser.get_format_instructions()
     })
 
@@ -130,6 +154,7 @@ def process_month(start_date, end_date, openai_api_key):
                 'social_emotional_explanation': monthly_summary.social_emotional_explanation,
             }
             summaries.append(summary)
+            put_user_month(summary, len(user_data))
             print(f"Added summary for user {user_id} to summaries list")
         except Exception as e:
             print(f"Error processing data for user {user_id}: {str(e)}")
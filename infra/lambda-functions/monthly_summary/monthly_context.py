@@ -0,0 +1,98 @@
+from collections import Counter
+import re
+
+# Compact encoder for the monthly prompt. Instead of pretty-printed JSON of
+# every raw daily item, only the fields the prompt uses are projected, the
+# per-day scores become a short table, notable words are merged into one
+# counted list and text repeated verbatim from an earlier day is emitted once.
+SCORE_COLUMNS = [
+    ('lang', 'language_communication_score'),
+    ('cog', 'cognitive_development_score'),
+    ('soc', 'social_emotional_score'),
+]
+# Explanations plus the sub-assessments the monthly explanations draw on
+TEXT_COLUMNS = [
+    ('lang', 'language_communication_explanation'),
+    ('lang.structure', 'language_communication_sentence_structure'),
+    ('cog', 'cognitive_development_explanation'),
+    ('cog.problem_solving', 'cognitive_development_problem_solving'),
+    ('cog.concepts', 'cognitive_development_conceptual_understanding'),
+    ('soc', 'social_emotional_explanation'),
+    ('soc.expression', 'social_emotional_emotional_expression'),
+    ('soc.interaction', 'social_emotional_social_interaction'),
+]
+NOTABLE_WORDS_FIELD = 'language_communication_notable_words'
+PROMPT_FIELDS = (
+    ['date', 'summary_title', 'summary', NOTABLE_WORDS_FIELD]
+    + [field for _, field in SCORE_COLUMNS]
+    + [field for _, field in TEXT_COLUMNS]
+)
+
+def project(item):
+    return {field: item[field] for field in PROMPT_FIELDS if field in item}
+
+def format_number(value):
+    value = float(value)
+    return str(int(value)) if value.is_integer() else f"{value:.2f}".rstrip('0')
+
+def normalize(text):
+    return ' '.join(str(text).split())
+
+def clip(text, max_chars):
+    if max_chars and len(text) > max_chars:
+        return text[:max_chars - 1].rstrip() + '…'
+    return text
+
+def split_words(notable_words):
+    if isinstance(notable_words, (list, set, tuple)):
+        words = notable_words
+    else:
+        words = re.split(r'[,\n;]+', str(notable_words))
+    return [w.strip().strip('"\'').lower() for w in words if w.strip().strip('"\'')]
+
+def encode_average_scores(average_scores):
+    return ', '.join(f"{field}: {format_number(value)}" for field, value in average_scores.items())
+
+def encode_monthly_context(data, max_field_chars=None, deduplicate=True):
+    """Encode a user's daily items as a compact text block for the prompt.
+
+    max_field_chars optionally caps the length of every free-text field.
+    Duplicates are detected on the full text, before clipping.
+    """
+    rows = sorted((project(item) for item in data), key=lambda row: row.get('date', ''))
+
+    lines = ['scores (day|' + '|'.join(short for short, _ in SCORE_COLUMNS) + '):']
+    for row in rows:
+        scores = [format_number(row[field]) if field in row else '-' for _, field in SCORE_COLUMNS]
+        lines.append('|'.join([row.get('date', '')[-5:]] + scores))
+
+    word_counts = Counter()
+    for row in rows:
+        # Count each word at most once per day so the list reflects frequency across days
+        word_counts.update(set(split_words(row.get(NOTABLE_WORDS_FIELD, ''))))
+    if word_counts:
+        lines.append('notable words (word:days):')
+        lines.append(', '.join(f"{word}:{count}" for word, count in word_counts.most_common()))
+
+    lines.append('daily notes:')
+    seen = set()
+
+    def is_new(text):
+        if not text or (deduplicate and text in seen):
+            return False
+        seen.add(text)
+        return True
+
+    for row in rows:
+        header = f"{row.get('date', '')[-5:]} {clip(normalize(row.get('summary_title', '')), max_field_chars)}"
+        summary = normalize(row.get('summary', ''))
+        if is_new(summary):
+            header = f"{header}: {clip(summary, max_field_chars)}"
+        lines.append(header.rstrip())
+        for short, field in TEXT_COLUMNS:
+            text = normalize(row.get(field, ''))
+            # Text repeated verbatim from an earlier day adds no information
+            if is_new(text):
+                lines.append(f"  {short}: {clip(text, max_field_chars)}")
+
+    return '\n'.join(lines)
@@ -68,6 +68,16 @@ export class InfraStack extends cdk.Stack {
       billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
     });
 
+    // Per-user materialized view: DAY#YYYY-MM-DD and MONTH#YYYY-MM rows so a
+    // dashboard timeline is a single key-range query on userId. Rewriting a
+    // DAY# row also refreshes the rolling 7/30/90 day averages of later rows
+    const userSummaryTable = new dynamodb.Table(this, 'UserSummaryTable', {
+      partitionKey: { name: 'userId', type: dynamodb.AttributeType.STRING },
+      sortKey: { name: 'sk', type: dynamodb.AttributeType.STRING },
+      billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
+      removalPolicy: cdk.RemovalPolicy.DESTROY,
+    });
+
     const userNGWordsTable = new dynamodb.Table(this, 'UserNGWordsTable', {
       partitionKey: { name: 'userId', type: dynamodb.AttributeType.STRING },
       billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
@@ -84,12 +94,14 @@ export class InfraStack extends cdk.Stack {
     new DailySummaryProcessor(this, 'DailySummaryProcessor', {
       conversationTable: conversationTable,
       dailySummaryTable: dailySummaryTable,
+      userSummaryTable: userSummaryTable,
       openAiApiKeyParameterName: 'openAiApiKey',
     }); 
 
     new MonthlySummaryProcessor(this, 'MonthlySummaryProcessor', {
       dailySummaryTable: dailySummaryTable,
       monthlySummaryTable: monthlySummaryTable,
+      userSummaryTable: userSummaryTable,
       openAiApiKeyParameterName: 'openAiApiKey',
     });
 
@@ -104,6 +116,11 @@ export class InfraStack extends cdk.Stack {
       description: 'DynamoDB Table Name for File Info',
     });
 
+    new cdk.CfnOutput(this, 'UserSummaryTableName', {
+      value: userSummaryTable.tableName,
+      description: 'DynamoDB Table Name for per-user summary timeline',
+    });
+
     // Add output for UserTable
     new cdk.CfnOutput(this, 'UserNGWordsTableName', {
       value: userNGWordsTable.tableName,
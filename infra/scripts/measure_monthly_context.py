@@ -0,0 +1,103 @@
+"""Measure prompt tokens saved by the compact monthly context encoder.
+
+Builds a synthetic month of daily summary items whose free text varies from
+day to day (as real LLM output does) and reports token counts for the raw
+JSON payload, the projected JSON, the compact encoding without and with
+deduplication, and the compact encoding under several per-field budgets.
+
+Usage: python scripts/measure_monthly_context.py [days]
+"""
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda-functions', 'monthly_summary'))
+from monthly_context import encode_monthly_context, project  # noqa: E402
+
+VOCABULARY = ['dinosaur', 'rainbow', 'because', 'tomorrow', 'rocket', 'bicycle', 'puzzle', 'butterfly',
+              'volcano', 'counting', 'sharing', 'friend', 'castle', 'garden', 'ocean', 'planet', 'kitten',
+              'recipe', 'shadow', 'thunder']
+OPENERS = ['Today the child', 'During the conversation the child', 'In several exchanges the child',
+           'Throughout the session the child', 'Early in the chat the child', 'When prompted the child']
+LANGUAGE = ['used complete sentences with connectives such as "because" and "so"',
+            'combined two ideas into compound sentences more often than before',
+            'asked detailed "why" and "how" questions using new vocabulary',
+            'retold a short story in order with clear beginning and end',
+            'described objects with several adjectives and comparisons',
+            'corrected their own grammar mid-sentence on a few occasions']
+COGNITIVE = ['reasoned about cause and effect', 'sorted items into categories without help',
+             'predicted what would happen next in a story', 'counted and compared small quantities',
+             'remembered details from an earlier conversation', 'proposed two different solutions to a problem']
+SOCIAL = ['expressed excitement and named feelings clearly', 'showed empathy when Teddy described a sad toy',
+          'waited for their turn and responded to questions', 'became briefly frustrated but calmed down quickly',
+          'shared a story about playing with a friend', 'asked Teddy how it was feeling']
+CLOSERS = ['which is typical for their age.', 'showing steady progress.', 'with some adult-like phrasing.',
+           'though attention drifted toward the end.', 'and seemed proud of it.', 'with occasional hesitation.']
+
+def sentence(rng, topic, pool):
+    return f"{rng.choice(OPENERS)} {rng.choice(pool)} while talking about {topic}, {rng.choice(CLOSERS)}"
+
+def synthetic_month(days=30, user_id='synthetic-user', seed=0):
+    rng = random.Random(seed)
+    start = datetime(2024, 5, 1)
+    data = []
+    for day in range(days):
+        date = (start + timedelta(days=day)).strftime('%Y-%m-%d')
+        topic = rng.choice(VOCABULARY)
+        data.append({
+            'userId': user_id,
+            'timestamp': Decimal(int(start.timestamp()) + day * 86400),
+            'date': date,
+            'summary_title': f"Exploring {topic} with Teddy",
+            'summary': f"The child talked with Teddy about {topic} and {rng.choice(VOCABULARY)}. "
+                       + sentence(rng, topic, COGNITIVE),
+            'language_communication_score': Decimal(rng.randint(4, 8)),
+            'language_communication_explanation': sentence(rng, topic, LANGUAGE) + ' ' + sentence(rng, topic, LANGUAGE),
+            'language_communication_notable_words': ', '.join(rng.sample(VOCABULARY, 10)),
+            'language_communication_sentence_structure': sentence(rng, topic, LANGUAGE),
+            'cognitive_development_score': Decimal(rng.randint(4, 8)),
+            'cognitive_development_explanation': sentence(rng, topic, COGNITIVE) + ' ' + sentence(rng, topic, COGNITIVE),
+            'cognitive_development_problem_solving': sentence(rng, topic, COGNITIVE),
+            'cognitive_development_conceptual_understanding': sentence(rng, topic, COGNITIVE),
+            'social_emotional_score': Decimal(rng.randint(4, 8)),
+            'social_emotional_explanation': sentence(rng, topic, SOCIAL) + ' ' + sentence(rng, topic, SOCIAL),
+            'social_emotional_emotional_expression': sentence(rng, topic, SOCIAL),
+            'social_emotional_social_interaction': sentence(rng, topic, SOCIAL),
+        })
+    return data
+
+def _has_tiktoken():
+    try:
+        import tiktoken  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def count_tokens(text):
+    if _has_tiktoken():
+        import tiktoken
+        return len(tiktoken.get_encoding('cl100k_base').encode(text))
+    # Rough estimate for English text when tiktoken is not available
+    return (len(text) + 3) // 4
+
+def main(days=30):
+    data = synthetic_month(days)
+    raw = count_tokens(json.dumps(data, default=float, indent=2))
+    results = [
+        ('raw json (current payload)', raw),
+        ('projected json', count_tokens(json.dumps([project(item) for item in data], default=float, indent=2))),
+        ('compact, no dedup', count_tokens(encode_monthly_context(data, deduplicate=False))),
+        ('compact + dedup', count_tokens(encode_monthly_context(data))),
+    ]
+    for budget in [200, 120, 60]:
+        results.append((f"compact + dedup, {budget} chars/field", count_tokens(encode_monthly_context(data, budget))))
+
+    print(f"{days} synthetic days, tokens counted with {'tiktoken' if _has_tiktoken() else 'a chars/4 estimate'}")
+    for label, tokens in results:
+        print(f"{label:<36} {tokens:>7} tokens  {1 - tokens / raw:6.1%} saved")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)